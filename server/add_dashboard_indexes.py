@@ -0,0 +1,88 @@
+"""
+Migration script to add the partial indexes used by the dashboard stats query
+Run this once on existing databases; new databases get them from create_all()
+"""
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+load_dotenv()
+
+from sqlalchemy import text
+from sqlalchemy.schema import CreateIndex, DropIndex
+from app.database import Base, engine
+from app import models  # noqa: F401 - registers the tables on Base.metadata
+
+# Index names declared on the models; the DDL itself comes from Base.metadata
+INDEX_NAMES = [
+    "ix_interactions_user_id",
+    "ix_interactions_user_ts_contact",
+    "ix_alerts_user_unread",
+    "ix_reminders_user_active",
+]
+
+# Fail fast instead of queueing behind long transactions (and stalling readers queued behind us)
+LOCK_TIMEOUT = os.getenv("MIGRATION_LOCK_TIMEOUT", "2s")
+
+def get_indexes():
+    indexes = {index.name: index for table in Base.metadata.tables.values() for index in table.indexes}
+    return [indexes[name] for name in INDEX_NAMES]
+
+def get_invalid_indexes(conn, names):
+    """Names of indexes left INVALID by an interrupted concurrent build."""
+    rows = conn.execute(
+        text("""
+            SELECT c.relname FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = ANY(:names) AND NOT i.indisvalid
+        """),
+        {"names": list(names)}
+    )
+    return {row.relname for row in rows}
+
+def main():
+    is_postgres = engine.dialect.name == "postgresql"
+    indexes = get_indexes()
+
+    print("Connecting to the database...")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        invalid = set()
+        if is_postgres:
+            conn.execute(text("SELECT set_config('lock_timeout', :timeout, false)"), {"timeout": LOCK_TIMEOUT})
+            # Index builds can outlast the app's statement_timeout
+            conn.execute(text("SELECT set_config('statement_timeout', '0', false)"))
+            # CONCURRENTLY avoids blocking writes but cannot run inside a transaction
+            # (only set here: create_all builds these indexes inside one)
+            for index in indexes:
+                index.dialect_options["postgresql"]["concurrently"] = True
+            invalid = get_invalid_indexes(conn, INDEX_NAMES)
+
+        for index in indexes:
+            try:
+                # IF NOT EXISTS would silently keep an INVALID index, so rebuild those
+                if index.name in invalid:
+                    print(f"Dropping invalid index {index.name}...")
+                    conn.execute(DropIndex(index, if_exists=True))
+                print(f"Creating index {index.name}...")
+                conn.execute(CreateIndex(index, if_not_exists=True))
+            except Exception as e:
+                # A failed concurrent build leaves an INVALID index; drop it so the next run starts clean
+                if is_postgres:
+                    conn.execute(DropIndex(index, if_exists=True))
+                print(f"\n✗ Error creating {index.name}: {e}")
+                print("Re-run this script once the table is less busy.")
+                sys.exit(1)
+
+        if is_postgres:
+            still_invalid = get_invalid_indexes(conn, INDEX_NAMES)
+            if still_invalid:
+                print(f"\n✗ Indexes still invalid: {', '.join(sorted(still_invalid))}")
+                sys.exit(1)
+
+    print(f"\n✓ Dashboard indexes are in place ({len(indexes)} total)")
+
+if __name__ == "__main__":
+    main()
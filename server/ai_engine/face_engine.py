@@ -106,7 +106,8 @@ def recognize_face(app, image, threshold=0.45, user_id=None):
             query_result = collection.query(
                 query_embeddings=[current_emb],
                 n_results=1,
-                where=where_filter
+                where=where_filter,
+                include=["metadatas", "distances"]
             )
             
             match_found = False
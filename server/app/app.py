@@ -13,7 +13,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 
 from starlette.middleware.sessions import SessionMiddleware
 
-from .database import Base, engine
+from .database import Base, engine, get_pool_status
 from .routes.authRoutes import router as auth_router
 from .routes.faceRoutes import router as face_router
 from .routes.contactRoutes import router as contact_router
@@ -138,4 +138,9 @@ def scheduler_health():
         "running": scheduler.running,
         "check_interval": scheduler.check_interval,
         "last_reset_date": str(scheduler.last_reset_date) if scheduler.last_reset_date else None
-    }
\ No newline at end of file
+    }
+
+@app.get("/health/db")
+def db_pool_health():
+    """Connection pool usage, for tuning the DB_*POOL_SIZE / DB_*MAX_OVERFLOW settings"""
+    return get_pool_status()
\ No newline at end of file
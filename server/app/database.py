@@ -1,6 +1,9 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 import os
 from dotenv import load_dotenv
 
@@ -11,9 +14,71 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set in environment variables")
 
-engine = create_engine(DATABASE_URL)
+IS_POSTGRES = make_url(DATABASE_URL).get_backend_name() == "postgresql"
+
+# Connection pool tuning (Postgres only; SQLite keeps SQLAlchemy's defaults).
+# Both engines draw from the same max_connections budget (default 100), so the
+# async engine, which only serves the stats endpoints, gets its own small pool.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", "5"))
+DB_ASYNC_MAX_OVERFLOW = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "5"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))  # 0 disables
+# Serverless deployments should not hold connections between invocations
+DB_NULL_POOL = os.getenv("DB_NULL_POOL", "false").lower() == "true"
+
+def _pool_options(pool_size, max_overflow):
+    if not IS_POSTGRES:
+        return {}
+    if DB_NULL_POOL:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_recycle": DB_POOL_RECYCLE,
+        # Keepalives only catch dead TCP peers; pre-ping also catches connections
+        # the server or a proxy closed (restarts, idle timeouts) at the cost of
+        # one round-trip per checkout, instead of failing the request
+        "pool_pre_ping": True,
+    }
+
+def _connect_args():
+    if not IS_POSTGRES:
+        return {}
+    return {
+        "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}",
+        # TCP keepalives so idle pooled connections are not silently dropped
+        "keepalives": 1,
+        "keepalives_idle": 30,
+    }
+
+# Raise the compiled-SQL LRU ceiling (default 500) so hot statements stay cached
+engine = create_engine(DATABASE_URL, query_cache_size=1200, connect_args=_connect_args(), **_pool_options(DB_POOL_SIZE, DB_MAX_OVERFLOW))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _async_database_url(url):
+    """Map DATABASE_URL onto its async driver (asyncpg / aiosqlite)."""
+    url = make_url(url)
+    connect_args = {}
+    if url.get_backend_name() == "postgresql":
+        # asyncpg takes the libpq sslmode through its own ssl argument
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        query.pop("channel_binding", None)
+        if sslmode:
+            connect_args["ssl"] = sslmode
+        connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url, connect_args
+
+# Async engine for I/O-bound endpoints that run on the event loop
+_async_url, _async_connect_args = _async_database_url(DATABASE_URL)
+async_engine = create_async_engine(_async_url, query_cache_size=1200, connect_args=_async_connect_args, **_pool_options(DB_ASYNC_POOL_SIZE, DB_ASYNC_MAX_OVERFLOW))
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -22,3 +87,25 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_pool_status():
+    """Connection pool usage for the sync and async engines."""
+    def status(pool):
+        # NullPool (serverless) and SQLite's default pools don't track checkouts
+        if not hasattr(pool, "checkedout"):
+            return {"pool": type(pool).__name__}
+        return {
+            "pool": type(pool).__name__,
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+
+    return {
+        "sync": status(engine.pool),
+        "async": status(async_engine.pool),
+    }
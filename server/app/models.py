@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, JSON, LargeBinary
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, JSON, LargeBinary, Index
 from sqlalchemy.orm import relationship as sa_relationship
 from sqlalchemy.sql import func
 from .database import Base
@@ -61,6 +61,17 @@ class Interaction(Base):
 
     user = sa_relationship("User", back_populates="interactions")
 
+    __table_args__ = (
+        # Dashboard "conversations" count
+        Index("ix_interactions_user_id", "user_id"),
+        # Covers the dashboard "visitors today" count
+        Index(
+            "ix_interactions_user_ts_contact", "user_id", timestamp.desc(), "contact_id",
+            postgresql_where=contact_id.isnot(None),
+            sqlite_where=contact_id.isnot(None),
+        ),
+    )
+
 class Alert(Base):
     __tablename__ = "alerts"
 
@@ -76,6 +87,10 @@ class Alert(Base):
 
     user = sa_relationship("User", back_populates="alerts")
 
+    __table_args__ = (
+        Index("ix_alerts_user_unread", "user_id", postgresql_where=read == False, sqlite_where=read == False),
+    )
+
 class Reminder(Base):
     __tablename__ = "reminders"
 
@@ -93,6 +108,14 @@ class Reminder(Base):
 
     user = sa_relationship("User", back_populates="reminders")
 
+    __table_args__ = (
+        Index(
+            "ix_reminders_user_active", "user_id",
+            postgresql_where=(completed == False) & (enabled == True),
+            sqlite_where=(completed == False) & (enabled == True),
+        ),
+    )
+
 class SOSContact(Base):
     __tablename__ = "sos_contacts"
 
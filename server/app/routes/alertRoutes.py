@@ -7,6 +7,7 @@ from datetime import datetime
 from ..database import get_db
 from ..models import Alert, User
 from ..utils.auth import get_current_user
+from ..services.stats_cache import invalidate_dashboard_stats
 
 router = APIRouter(
     prefix="/alerts",
@@ -92,6 +93,7 @@ def mark_all_read(
 ):
     result = db.query(Alert).filter(Alert.user_id == current_user.id, Alert.read == False).update({"read": True})
     db.commit()
+    invalidate_dashboard_stats(current_user.id)
     return {"updated_count": result}
 
 @router.delete("/{alert_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -115,4 +117,5 @@ def delete_all_alerts(
 ):
     db.query(Alert).filter(Alert.user_id == current_user.id).delete()
     db.commit()
+    invalidate_dashboard_stats(current_user.id)
     return None
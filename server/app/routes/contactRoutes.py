@@ -246,7 +246,8 @@ def remove_contact_from_chroma(contact_id: int):
         # Query for all embeddings belonging to this contact
         try:
             results = collection.get(
-                where={"contact_id": contact_id}
+                where={"contact_id": contact_id},
+                include=[]  # Only the ids are needed for the delete
             )
             
             if results and results['ids']:
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct
-from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, exists, func, distinct, bindparam, literal_column
+from datetime import datetime, timezone
 from typing import Dict
+import logging
 
-from ..database import get_db
+from ..database import get_async_db, async_engine
 from ..models import Interaction, Alert, Reminder, User
-from ..utils.auth import get_current_user
+from ..utils.auth import get_current_user_async
+from ..services import stats_cache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/stats",
@@ -14,10 +18,61 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Start of the current UTC day, computed by the database so no timestamp
+# has to be built and bound per request
+_TODAY_START_SQL = {
+    "postgresql": "(date_trunc('day', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC')",
+    "sqlite": "datetime('now', 'start of day')",
+}[async_engine.dialect.name]
+
+# All four dashboard counts in a single round-trip. Built once at import time
+# so every request reuses the same statement and its compiled form. Each count
+# is its own scalar subquery so its predicate matches one of the indexes
+# declared on the models, and boolean literals render per dialect (false / 0)
+# so SQLite's partial indexes match too:
+# - visitors: unique known contacts with an interaction today (ix_interactions_user_ts_contact)
+# - conversations: all interactions (ix_interactions_user_id)
+# - unread: unread alerts (ix_alerts_user_unread)
+# - upcoming: reminders that are not completed and enabled (ix_reminders_user_active)
+_UID = bindparam("uid")
+_DASHBOARD_STATS_STMT = select(
+    select(func.count(distinct(Interaction.contact_id))).where(
+        Interaction.user_id == _UID,
+        Interaction.contact_id.isnot(None),
+        Interaction.timestamp >= literal_column(_TODAY_START_SQL)
+    ).scalar_subquery().label("visitors"),
+    select(func.count()).select_from(Interaction).where(
+        Interaction.user_id == _UID
+    ).scalar_subquery().label("conversations"),
+    select(func.count()).select_from(Alert).where(
+        Alert.user_id == _UID,
+        Alert.read == False
+    ).scalar_subquery().label("unread"),
+    select(func.count()).select_from(Reminder).where(
+        Reminder.user_id == _UID,
+        Reminder.completed == False,
+        Reminder.enabled == True
+    ).scalar_subquery().label("upcoming"),
+)
+
+def _stats_etag(user_id: int, stats: Dict) -> str:
+    """Weak ETag derived from the user and their stat values."""
+    digest = hash((
+        user_id,
+        stats["visitors"],
+        stats["conversations"],
+        stats["unreadAlerts"],
+        stats["upcomingReminders"],
+    ))
+    return f'W/"{digest & 0xFFFFFFFFFFFFFFFF:x}"'
+
 @router.get("/dashboard")
-def get_dashboard_stats(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def get_dashboard_stats(
+    request: Request,
+    response: Response,
+    debug: bool = Query(False, description="Include today's interactions in the response"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ) -> Dict:
     """
     Get dashboard statistics for the current user.
@@ -26,55 +81,103 @@ def get_dashboard_stats(
     - conversations: total interactions count
     - unreadAlerts: count of unread alerts
     - upcomingReminders: count of incomplete reminders
-    """
-    
-    # Get today's date range (start of day to now) - timezone aware
-    now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    # Debug: Log the date range being used
-    print(f"[Stats] Checking visitors from {today_start} to {now}")
-    print(f"[Stats] User ID: {current_user.id}")
+    - debug: today's interactions (only when ?debug=1)
     
-    # Count unique visitors today (unique contact_ids in interactions)
-    visitors_today = db.query(func.count(distinct(Interaction.contact_id))).filter(
-        Interaction.user_id == current_user.id,
-        Interaction.contact_id.isnot(None),  # Only count interactions with known contacts
-        Interaction.timestamp >= today_start
-    ).scalar() or 0
+    Responses carry a weak ETag and a short private max-age so polling
+    clients can reuse them or revalidate with If-None-Match (304).
+    """
     
-    # Debug: Check all interactions today
-    all_interactions_today = db.query(Interaction).filter(
-        Interaction.user_id == current_user.id,
-        Interaction.timestamp >= today_start
-    ).all()
-    print(f"[Stats] Total interactions today: {len(all_interactions_today)}")
-    for interaction in all_interactions_today:
-        print(f"[Stats] - Interaction {interaction.id}: contact_id={interaction.contact_id}, timestamp={interaction.timestamp}")
+    # Serve repeat hits (e.g. dashboard polling) from the cache. The generation
+    # is read first so a result that races an invalidation is not cached.
+    generation = stats_cache.get_generation(current_user.id)
+    cached = stats_cache.get_dashboard_stats(current_user.id)
+    if cached is not None and not debug:
+        result = dict(cached)
+    else:
+        row = (await db.execute(
+            _DASHBOARD_STATS_STMT,
+            {"uid": current_user.id}
+        )).one()
+        stats = row._mapping
+        
+        logger.debug(
+            "User %s stats - visitors: %s, conversations: %s, alerts: %s, reminders: %s",
+            current_user.id, stats["visitors"], stats["conversations"], stats["unread"], stats["upcoming"]
+        )
+        
+        result = {
+            "visitors": stats["visitors"] or 0,
+            "conversations": stats["conversations"] or 0,
+            "unreadAlerts": stats["unread"] or 0,
+            "upcomingReminders": stats["upcoming"] or 0
+        }
+        stats_cache.set_dashboard_stats(current_user.id, dict(result), generation)
     
-    # Total conversations (all interactions)
-    total_conversations = db.query(func.count(Interaction.id)).filter(
-        Interaction.user_id == current_user.id
-    ).scalar() or 0
+    # Row dump for troubleshooting the visitor count, only on explicit request
+    if debug:
+        today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        # Stream plain mapping rows in batches from a server-side cursor
+        interactions_today = await db.stream(
+            select(Interaction.id, Interaction.contact_id, Interaction.timestamp).where(
+                Interaction.user_id == current_user.id,
+                Interaction.timestamp >= today_start
+            ).execution_options(yield_per=500)
+        )
+        result["debug"] = {
+            "todayStart": today_start.isoformat(),
+            "interactionsToday": [
+                {
+                    "id": interaction["id"],
+                    "contact_id": interaction["contact_id"],
+                    "timestamp": interaction["timestamp"].isoformat() if interaction["timestamp"] else None
+                }
+                async for interaction in interactions_today.mappings()
+            ]
+        }
+        response.headers["Cache-Control"] = "no-store"
+        return result
     
-    # Unread alerts
-    unread_alerts = db.query(func.count(Alert.id)).filter(
-        Alert.user_id == current_user.id,
-        Alert.read == False
-    ).scalar() or 0
+    etag = _stats_etag(current_user.id, result)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": "private, max-age=5",
+        "Vary": "Authorization",
+    }
     
-    # Upcoming reminders (not completed and enabled)
-    upcoming_reminders = db.query(func.count(Reminder.id)).filter(
-        Reminder.user_id == current_user.id,
-        Reminder.completed == False,
-        Reminder.enabled == True
-    ).scalar() or 0
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=cache_headers)
     
-    print(f"[Stats] Results - visitors: {visitors_today}, conversations: {total_conversations}, alerts: {unread_alerts}, reminders: {upcoming_reminders}")
+    response.headers.update(cache_headers)
+    return result
+
+@router.get("/badges")
+async def get_badge_flags(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+) -> Dict:
+    """
+    Lightweight check for notification badges that only need "any" vs "none".
+    EXISTS lets the database stop at the first matching row instead of counting them all.
+    Returns:
+    - hasUnreadAlerts: at least one unread alert
+    - hasUpcomingReminders: at least one incomplete, enabled reminder
+    """
+    row = (await db.execute(
+        select(
+            exists().where(
+                Alert.user_id == current_user.id,
+                Alert.read == False
+            ).label("has_unread_alerts"),
+            exists().where(
+                Reminder.user_id == current_user.id,
+                Reminder.completed == False,
+                Reminder.enabled == True
+            ).label("has_upcoming_reminders")
+        )
+    )).one()
     
     return {
-        "visitors": visitors_today,
-        "conversations": total_conversations,
-        "unreadAlerts": unread_alerts,
-        "upcomingReminders": upcoming_reminders
+        "hasUnreadAlerts": bool(row.has_unread_alerts),
+        "hasUpcomingReminders": bool(row.has_upcoming_reminders)
     }
@@ -6,10 +6,14 @@ import logging
 
 from .database import SessionLocal
 from .models import Reminder, Alert, User
+from .services.stats_cache import invalidate_dashboard_stats
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+WEEKDAYS = frozenset({"Monday", "Tuesday", "Wednesday", "Thursday", "Friday"})
+WEEKENDS = frozenset({"Saturday", "Sunday"})
+
 class ReminderScheduler:
     def __init__(self):
         self.running = False
@@ -62,6 +66,7 @@ class ReminderScheduler:
                 ).update({"completed": False})
                 
                 db.commit()
+                invalidate_dashboard_stats()
                 self.last_reset_date = current_date
                 logger.info(f"Reset {updated} completed reminders for new day")
             except Exception as e:
@@ -127,11 +132,11 @@ class ReminderScheduler:
         
         elif recurrence == "weekdays":
             # Monday to Friday
-            return current_day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+            return current_day in WEEKDAYS
         
         elif recurrence == "weekends":
             # Saturday and Sunday
-            return current_day in ["Saturday", "Sunday"]
+            return current_day in WEEKENDS
         
         elif recurrence == "custom":
             # For custom, we'll treat it as daily for now
@@ -12,6 +12,9 @@ from google.genai import types
 
 from ..models import User, Contact, Reminder, Alert, Interaction, SOSContact
 
+# Chat history roles forwarded to the model (system messages are skipped)
+HISTORY_ROLES = frozenset({"user", "assistant"})
+
 
 class MindTraceAI:
     """AI Assistant for MindTrace with full app context."""
@@ -287,7 +290,7 @@ Remember: You have access to the user's current data (contacts, reminders, alert
             
             # Add conversation history (skip system messages)
             for msg in conversation_history[-10:]:  # Last 10 messages for context
-                if msg["role"] in ["user", "assistant"]:
+                if msg["role"] in HISTORY_ROLES:
                     role = "user" if msg["role"] == "user" else "model"
                     contents.append(types.Content(
                         role=role,
@@ -360,7 +363,7 @@ Remember: You have access to the user's current data (contacts, reminders, alert
             
             # Add conversation history
             for msg in conversation_history[-10:]:
-                if msg["role"] in ["user", "assistant"]:
+                if msg["role"] in HISTORY_ROLES:
                     role = "user" if msg["role"] == "user" else "model"
                     contents.append(types.Content(
                         role=role,
@@ -0,0 +1,72 @@
+import threading
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from ..models import Interaction, Alert, Reminder
+
+# Dashboard stats per user, keyed by user_id. Short TTL so "today" rolls over
+# and changes that bypass the ORM events below still show up quickly.
+dashboard_cache = TTLCache(maxsize=10_000, ttl=10)
+_lock = threading.Lock()
+
+# Invalidation generations. A request reads the generation before querying and
+# only stores its result if no invalidation happened while the query was in
+# flight; otherwise it could cache counts that a concurrent commit already made stale.
+_generations = {}
+_global_generation = 0
+
+def get_generation(user_id):
+    """Current invalidation generation for a user, to pass to set_dashboard_stats."""
+    with _lock:
+        return (_global_generation, _generations.get(user_id, 0))
+
+def get_dashboard_stats(user_id):
+    """Return the cached stats dict for a user, or None on a miss."""
+    with _lock:
+        return dashboard_cache.get(user_id)
+
+def set_dashboard_stats(user_id, stats, generation):
+    """Cache stats read at `generation`, unless the user was invalidated since."""
+    with _lock:
+        if generation != (_global_generation, _generations.get(user_id, 0)):
+            return False
+        dashboard_cache[user_id] = stats
+        return True
+
+def invalidate_dashboard_stats(user_id=None):
+    """Drop cached stats for one user, or for everyone when user_id is None."""
+    global _global_generation
+    with _lock:
+        if user_id is None:
+            _global_generation += 1
+            dashboard_cache.clear()
+        else:
+            _generations[user_id] = _generations.get(user_id, 0) + 1
+            dashboard_cache.pop(user_id, None)
+
+# Invalidate automatically whenever a row feeding the dashboard changes.
+# Mapper events fire at flush time, before the data is committed, so they only
+# record the affected users on the session; the cache is cleared once the
+# commit lands and the pending set is discarded on rollback.
+# Bulk query.update()/delete() calls skip these events and must invalidate explicitly.
+_PENDING_KEY = "dashboard_stats_users"
+
+def _record_target_user(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.user_id)
+
+def _invalidate_committed_users(session):
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_dashboard_stats(user_id)
+
+def _discard_pending_users(session):
+    session.info.pop(_PENDING_KEY, None)
+
+for _model in (Interaction, Alert, Reminder):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _record_target_user)
+
+event.listen(Session, "after_commit", _invalidate_committed_users)
+event.listen(Session, "after_rollback", _discard_pending_users)